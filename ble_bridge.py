@@ -20,6 +20,7 @@ import logging
 import signal
 import sys
 import os
+from operator import attrgetter
 from typing import Dict, List
 
 # Add current directory to path for imports
@@ -41,6 +42,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Module-level device->dict conversion; no instance state involved
+_DEVICE_KEYS = ('name', 'address', 'rssi', 'is_connected')
+_DEVICE_ATTRS = attrgetter(*_DEVICE_KEYS)
+
+def _device_to_dict(device) -> dict:
+    """Convert RNodeDevice to dictionary"""
+    return dict(zip(_DEVICE_KEYS, _DEVICE_ATTRS(device)))
+
 class BLEBridgeApp:
     """Standalone BLE Bridge Application"""
 
@@ -50,35 +59,57 @@ class BLEBridgeApp:
         self.running = False
         self.connected_devices: Dict[str, dict] = {}
 
-    async def scan_devices(self, timeout: float = 10.0) -> List[dict]:
+        # address -> device dict from the most recent scans, shared by the
+        # interactive flows so they don't rebuild lists per command
+        self._last_scan: Dict[str, dict] = {}
+
+        # Set to wake run_forever when shutdown is requested
+        self._stop_event = asyncio.Event()
+
+        # Bound simultaneous BLE connection attempts in auto-connect mode
+        self._connect_sem = asyncio.Semaphore(int(os.environ.get("BLE_BRIDGE_MAX_PARALLEL", "3")))
+
+    async def scan_devices(self, timeout: float = 10.0, expected_count: int = None) -> List[dict]:
         """Scan for RNode BLE devices"""
         print(f"\n🔍 Scanning for RNode devices ({timeout}s)...")
 
-        devices = await self.discovery.scan_for_rnodes(timeout)
+        devices = await self.discovery.scan_for_rnodes(timeout, expected_count=expected_count)
 
-        if devices:
-            print(f"\n✅ Found {len(devices)} RNode device(s):")
-            for i, device in enumerate(devices, 1):
-                print(f"  {i}. {device.name} ({device.address})")
-                if device.rssi:
-                    print(f"     RSSI: {device.rssi} dBm")
-        else:
+        # A fresh scan replaces the cache so devices that went away stop
+        # showing up in the interactive pick list
+        self._last_scan.clear()
+
+        # Print and convert in a single pass over the discovered devices,
+        # batching the output into one stdout write
+        results = []
+        parts = []
+        for i, device in enumerate(devices, 1):
+            if i == 1:
+                parts.append(f"\n✅ Found {len(devices)} RNode device(s):\n")
+            parts.append(f"  {i}. {device.name} ({device.address})\n")
+            if device.rssi:
+                parts.append(f"     RSSI: {device.rssi} dBm\n")
+            result = _device_to_dict(device)
+            results.append(result)
+            self._last_scan[result['address']] = result
+
+        if parts:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
+
+        if not results:
             print("\n❌ No RNode devices found")
             print("Make sure your RNode is:")
             print("  - Powered on and in BLE mode")
             print("  - Advertising Nordic UART Service")
             print("  - Not connected to another device")
 
-        return [self._device_to_dict(device) for device in devices]
+        return results
 
-    def _device_to_dict(self, device) -> dict:
-        """Convert RNodeDevice to dictionary"""
-        return {
-            'name': device.name,
-            'address': device.address,
-            'rssi': device.rssi,
-            'is_connected': device.is_connected
-        }
+    async def _ainput(self, prompt: str) -> str:
+        """Read user input without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, input, prompt)
 
     async def connect_device(self, address: str, pin: str = None) -> bool:
         """Connect to a specific device"""
@@ -90,15 +121,18 @@ class BLEBridgeApp:
             print(f"   Using PIN: {pin}")
 
         try:
-            success = await self.manager.connect_device(address)
+            async with self._connect_sem:
+                success = await self.manager.connect_device(address)
 
             if success:
                 # Get connection info
-                connected = self.manager.get_connected_devices()
-                device_info = next((d for d in connected if d['address'] == address), None)
+                device_info = self.manager.get_device_info(address)
 
                 if device_info:
                     self.connected_devices[address] = device_info
+                    # Keep the cached scan entry current for interactive flows
+                    if address in self._last_scan:
+                        self._last_scan[address]['is_connected'] = True
                     print(f"✅ Connected successfully!")
                     print(f"   Serial Port: {device_info['serial_port']}")
                     print(f"   Symlink: {device_info['symlink']}")
@@ -138,7 +172,7 @@ class BLEBridgeApp:
         # Ask for PIN
         while True:
             try:
-                pin = input("\n🔑 Enter PIN (or 'skip' to continue without pairing): ").strip()
+                pin = (await self._ainput("\n🔑 Enter PIN (or 'skip' to continue without pairing): ")).strip()
                 if pin.lower() in ['skip', 'q', 'quit']:
                     break
 
@@ -156,22 +190,37 @@ class BLEBridgeApp:
                 print("\n\n⏹️  Pairing cancelled")
                 break
 
-    async def auto_connect_all(self) -> int:
+    async def auto_connect_all(self, min_devices: int = 1) -> int:
         """Auto-connect to all discovered devices"""
         print("\n🚀 Auto-connecting to all discovered devices...")
 
-        devices = await self.scan_devices(5.0)
+        devices = await self.scan_devices(5.0, expected_count=min_devices)
         if not devices:
             return 0
 
-        connected_count = 0
-        for device in devices:
-            if not device['is_connected']:
-                success = await self.connect_device(device['address'])
-                if success:
-                    connected_count += 1
+        # Connect known-good devices first: they were verified on a previous
+        # run and are the most likely to succeed quickly
+        devices.sort(key=lambda d: not self.discovery.is_known(d['address']))
+
+        # Weed out incompatible devices up front so we don't pay a full
+        # connect attempt on each; cached devices verify without I/O
+        rnodes = [self.discovery.get_device_by_address(d['address']) for d in devices]
+        compat = await self.discovery.verify_all([r for r in rnodes if r])
+        skipped = [d for d in devices if not compat.get(d['address'], True)]
+        for device in skipped:
+            print(f"⚠️  Skipping incompatible device {device['name']} ({device['address']})")
+        devices = [d for d in devices if compat.get(d['address'], True)]
+
+        # Connect to devices in parallel; the semaphore bounds concurrency
+        tasks = [
+            asyncio.create_task(self.connect_device(device['address']))
+            for device in devices if not device['is_connected']
+        ]
+        if not tasks:
+            return 0
 
-        return connected_count
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return sum(1 for result in results if result is True)
 
     async def interactive_mode(self):
         """Interactive device selection and connection"""
@@ -180,7 +229,7 @@ class BLEBridgeApp:
 
         while True:
             try:
-                command = input("\nble-bridge> ").strip().lower()
+                command = (await self._ainput("\nble-bridge> ")).strip().lower()
 
                 if command in ['q', 'quit', 'exit']:
                     break
@@ -210,7 +259,12 @@ class BLEBridgeApp:
 
     async def interactive_connect(self):
         """Interactive device connection"""
-        devices = await self.scan_devices(5.0)
+        # Reuse the cached scan results when available; an explicit 'scan'
+        # command refreshes them
+        if not self._last_scan:
+            await self.scan_devices(5.0)
+
+        devices = list(self._last_scan.values())
         if not devices:
             return
 
@@ -220,7 +274,7 @@ class BLEBridgeApp:
             print(f"  {i}. {device['name']} ({device['address']}) - {status}")
 
         try:
-            choice = input("\nSelect device number (or 'cancel'): ").strip()
+            choice = (await self._ainput("\nSelect device number (or 'cancel'): ")).strip()
             if choice.lower() in ['cancel', 'c', 'q']:
                 return
 
@@ -228,7 +282,7 @@ class BLEBridgeApp:
             if 0 <= device_idx < len(devices):
                 device = devices[device_idx]
                 if not device['is_connected']:
-                    pin = input("Enter PIN (optional): ").strip() or None
+                    pin = (await self._ainput("Enter PIN (optional): ")).strip() or None
                     await self.connect_device(device['address'], pin)
                 else:
                     print("Device is already connected")
@@ -240,15 +294,17 @@ class BLEBridgeApp:
 
     async def list_connected_devices(self):
         """List currently connected devices"""
-        connected = self.manager.get_connected_devices()
-
-        if connected:
-            print(f"\n🔗 Connected Devices ({len(connected)}):")
-            for device in connected:
-                print(f"  • {device['device']} ({device['address']})")
-                print(f"    Serial Port: {device['serial_port']}")
-                print(f"    Symlink: {device['symlink']}")
-                print()
+        parts = []
+        for device in self.manager.iter_connected_devices():
+            if not parts:
+                parts.append("\n🔗 Connected Devices:\n")
+            parts.append(f"  • {device['device']} ({device['address']})\n")
+            parts.append(f"    Serial Port: {device['serial_port']}\n")
+            parts.append(f"    Symlink: {device['symlink']}\n\n")
+
+        if parts:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
         else:
             print("\n❌ No devices currently connected")
 
@@ -272,15 +328,22 @@ class BLEBridgeApp:
             return False
 
         self.running = True
+        self._stop_event.clear()
         print("✅ BLE Bridge is running")
         return True
 
+    def request_stop(self):
+        """Signal run_forever to shut down (safe to call from a signal handler)"""
+        self._stop_event.set()
+
     async def stop_bridge(self):
         """Stop the BLE bridge service"""
         if self.running:
             print("\n⏹️  Stopping BLE Bridge...")
             await self.manager.stop()
+            await self.discovery.close()
             self.running = False
+            self._stop_event.set()
             print("✅ BLE Bridge stopped")
 
     async def run_forever(self):
@@ -292,8 +355,8 @@ class BLEBridgeApp:
         print("💡 Connected devices will remain available as virtual serial ports.")
 
         try:
-            while self.running:
-                await asyncio.sleep(1)
+            # Block until shutdown is requested instead of polling a flag
+            await self._stop_event.wait()
         except KeyboardInterrupt:
             print("\n")
         finally:
@@ -326,6 +389,8 @@ Examples:
                         help='Run as background service')
     parser.add_argument('--timeout', type=float, default=10.0,
                         help='Scan timeout in seconds (default: 10)')
+    parser.add_argument('--min-devices', type=int, default=1,
+                        help='Stop scanning early once this many devices are found (default: 1)')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Enable verbose logging')
 
@@ -337,12 +402,19 @@ Examples:
 
     app = BLEBridgeApp()
 
-    # Handle Ctrl+C gracefully
-    def signal_handler(sig, frame):
+    # Handle Ctrl+C / SIGTERM gracefully
+    def request_shutdown():
         print("\n\n⏹️  Shutting down...")
         asyncio.create_task(app.stop_bridge())
 
-    signal.signal(signal.SIGINT, signal_handler)
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, request_shutdown)
+        loop.add_signal_handler(signal.SIGTERM, request_shutdown)
+    except NotImplementedError:
+        # Windows: fall back to a plain signal handler that just sets the
+        # stop event; run_forever performs the actual shutdown
+        signal.signal(signal.SIGINT, lambda sig, frame: app.request_stop())
 
     try:
         if args.scan:
@@ -364,7 +436,7 @@ Examples:
         elif args.auto:
             # Auto-connect mode
             await app.start_bridge()
-            count = await app.auto_connect_all()
+            count = await app.auto_connect_all(args.min_devices)
             print(f"\n✅ Connected to {count} device(s)")
             if count > 0:
                 await app.run_forever()
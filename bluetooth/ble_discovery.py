@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 import asyncio
+import json
 import logging
+import os
+import re
 from typing import List, Dict, Optional, Callable
 import platform
 
@@ -14,15 +17,61 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Matches all RNode-ish device names in a single C-level scan
+_RNODE_NAME_RE = re.compile(r"rnode|reticulum|lora", re.IGNORECASE)
+
 class RNodeDevice:
     """Represents a discovered RNode BLE device"""
 
+    __slots__ = ('device', '_name', 'address', 'rssi', '_is_connected', '_dict',
+                 '_serial_name')
+
     def __init__(self, device: BLEDevice, name: str = None):
         self.device = device
-        self.name = name or device.name or "Unknown RNode"
+        self._name = name
         self.address = device.address
         self.rssi = getattr(device, 'rssi', None)
-        self.is_connected = False
+        self._is_connected = False
+        self._dict = None
+        self._serial_name = None
+
+    @property
+    def name(self) -> str:
+        """Device name, resolved lazily on first access"""
+        if self._name is None:
+            self._name = self.device.name or "Unknown RNode"
+        return self._name
+
+    @property
+    def serial_name(self) -> str:
+        """Virtual serial port name, computed once per device"""
+        if self._serial_name is None:
+            self._serial_name = f"RNode-{self.address.replace(':', '').upper()}"
+        return self._serial_name
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    @is_connected.setter
+    def is_connected(self, value: bool):
+        if value != self._is_connected:
+            self._is_connected = value
+            self._dict = None  # invalidate the cached dict form
+
+    @property
+    def as_dict(self) -> dict:
+        """Dict form shared across event payloads, rebuilt on state change"""
+        d = self._dict
+        if d is None:
+            d = {
+                'name': self.name,
+                'address': self.address,
+                'rssi': self.rssi,
+                'is_connected': self._is_connected
+            }
+            self._dict = d
+        return d
 
     def __str__(self):
         return f"RNode({self.name} - {self.address})"
@@ -38,66 +87,147 @@ class BLEDiscovery:
     NORDIC_UART_RX_UUID = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"  # Write to RNode
     NORDIC_UART_TX_UUID = "6e400003-b5a3-f393-e0a9-e50e24dcca9e"  # Read from RNode
 
+    # Precomputed lowercase forms for hot-path comparisons, so per-advertisement
+    # checks don't re-lower the constants
+    _NORDIC_UART_SERVICE_UUID_LC = NORDIC_UART_SERVICE_UUID.lower()
+    _NORDIC_UART_RX_UUID_LC = NORDIC_UART_RX_UUID.lower()
+    _NORDIC_UART_TX_UUID_LC = NORDIC_UART_TX_UUID.lower()
+    _UUIDS_LC = frozenset({_NORDIC_UART_SERVICE_UUID_LC})
+
+    # Persisted per-address service info so verified devices skip
+    # re-connection and service discovery on subsequent runs
+    SERVICE_CACHE_PATH = os.path.expanduser("~/.cache/rnode-ble-bridge/services.json")
+
     def __init__(self):
         self.discovered_devices: Dict[str, RNodeDevice] = {}
         self.scan_callbacks: List[Callable[[RNodeDevice], None]] = []
+        # Snapshot of scan_callbacks iterated on the per-advertisement hot path
+        self._callback_tuple: tuple = ()
         self.is_scanning = False
 
+        # Connected clients reused across get_device_info/verify calls
+        self._client_cache: Dict[str, BleakClient] = {}
+        self._service_cache: Dict[str, Dict] = self._load_service_cache()
+
+        # Scanner reused across scans (re-registering one per scan is a
+        # non-trivial fixed cost on BlueZ); per-scan state lives below
+        self._scanner: Optional[BleakScanner] = None
+        self._scanner_filtered: Optional[bool] = None
+        self._scan_seen: set = set()
+        self._scan_found: Optional[asyncio.Event] = None
+        self._scan_expected: Optional[int] = None
+        self._scan_service_filter: bool = True
+
     def add_discovery_callback(self, callback: Callable[[RNodeDevice], None]):
         """Add callback for when new RNode devices are discovered"""
         self.scan_callbacks.append(callback)
+        self._callback_tuple = tuple(self.scan_callbacks)
 
     def remove_discovery_callback(self, callback: Callable[[RNodeDevice], None]):
         """Remove discovery callback"""
         if callback in self.scan_callbacks:
             self.scan_callbacks.remove(callback)
+            self._callback_tuple = tuple(self.scan_callbacks)
+
+    async def scan_for_rnodes(self, timeout: float = 10.0,
+                              expected_count: Optional[int] = None,
+                              service_filter: bool = True) -> List[RNodeDevice]:
+        """Scan for RNode devices advertising Nordic UART service.
+
+        If expected_count is given, the scan returns as soon as that many
+        devices have been discovered instead of waiting out the full timeout.
 
-    async def scan_for_rnodes(self, timeout: float = 10.0) -> List[RNodeDevice]:
-        """Scan for RNode devices advertising Nordic UART service"""
-        logger.info(f"Scanning for RNode devices (timeout: {timeout}s)")
+        With service_filter enabled (the default) the Nordic UART UUID is
+        pushed down to the OS scanner, so only matching advertisements reach
+        Python. Disable it to fall back to name-based matching for RNodes
+        that don't advertise the service UUID.
+        """
+        logger.info("Scanning for RNode devices (timeout: %ss)", timeout)
 
         self.is_scanning = True
         self.discovered_devices.clear()
 
-        try:
-            def detection_callback(device: BLEDevice, advertisement_data):
-                """Called when a BLE device is discovered during scanning"""
-                if self._is_rnode_device(device, advertisement_data):
-                    self._handle_rnode_discovery(device, advertisement_data)
-
-            # Start scanning
-            scanner = BleakScanner(detection_callback=detection_callback)
-            await scanner.start()
+        # Per-scan state consumed by _detection_callback: an event set once
+        # enough devices are seen, and the set of already-classified
+        # addresses (devices advertise several times per second, so only
+        # the first packet per address is classified)
+        self._scan_found = asyncio.Event()
+        self._scan_seen = set()
+        self._scan_expected = expected_count
+        self._scan_service_filter = service_filter
 
-            # Wait for timeout
-            await asyncio.sleep(timeout)
+        try:
+            # Reuse the scanner across scans; rebuild only if the filter
+            # setting changed
+            if self._scanner is None or self._scanner_filtered != service_filter:
+                # Active mode for faster discovery where supported
+                scanner_kwargs = {
+                    'detection_callback': self._detection_callback,
+                    'scanning_mode': 'active',
+                }
+                if service_filter:
+                    scanner_kwargs['service_uuids'] = [self.NORDIC_UART_SERVICE_UUID]
+
+                self._scanner = BleakScanner(**scanner_kwargs)
+                self._scanner_filtered = service_filter
+
+            await self._scanner.start()
+
+            # Wait until enough devices are found, bounded by the timeout
+            try:
+                await asyncio.wait_for(self._scan_found.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
 
             # Stop scanning
-            await scanner.stop()
+            await self._scanner.stop()
 
         except Exception as e:
-            logger.error(f"Error during BLE scan: {e}")
+            logger.error("Error during BLE scan: %s", e)
         finally:
             self.is_scanning = False
 
         devices = list(self.discovered_devices.values())
-        logger.info(f"Found {len(devices)} RNode device(s)")
+        logger.info("Found %d RNode device(s)", len(devices))
         return devices
 
+    def _detection_callback(self, device: BLEDevice, advertisement_data):
+        """Called when a BLE device is discovered during scanning"""
+        addr = device.address
+        if addr in self._scan_seen:
+            return
+        self._scan_seen.add(addr)
+
+        # When the OS-level UUID filter is active every callback is already
+        # a match; only fall back to Python-side matching for unfiltered scans
+        if self._scan_service_filter or self._is_rnode_device(device, advertisement_data):
+            self._handle_rnode_discovery(device, advertisement_data)
+            if self._scan_expected is not None and len(self.discovered_devices) >= self._scan_expected:
+                self._scan_found.set()
+
+    async def close(self):
+        """Release the persistent scanner and any cached client connections"""
+        if self._scanner is not None:
+            try:
+                await self._scanner.stop()
+            except Exception as e:
+                logger.debug("Error stopping scanner: %s", e)
+            self._scanner = None
+            self._scanner_filtered = None
+
+        await self.close_cached_clients()
+
     def _is_rnode_device(self, device: BLEDevice, advertisement_data) -> bool:
         """Check if discovered device is likely an RNode"""
 
         # Check for Nordic UART service in advertised services
-        if hasattr(advertisement_data, 'service_uuids'):
-            for uuid in advertisement_data.service_uuids:
-                if uuid.lower() == self.NORDIC_UART_SERVICE_UUID.lower():
-                    return True
+        uuids = getattr(advertisement_data, 'service_uuids', ()) or ()
+        if any(uuid.lower() in self._UUIDS_LC for uuid in uuids):
+            return True
 
         # Check device name patterns
-        if device.name:
-            name_lower = device.name.lower()
-            if any(pattern in name_lower for pattern in ['rnode', 'reticulum', 'lora']):
-                return True
+        if device.name and _RNODE_NAME_RE.search(device.name):
+            return True
 
         # For devices without clear identifiers, we'll need to connect and check services
         # This is more invasive but might be necessary for some RNode implementations
@@ -105,18 +235,84 @@ class BLEDiscovery:
 
     def _handle_rnode_discovery(self, device: BLEDevice, advertisement_data):
         """Process discovered RNode device"""
-        if device.address not in self.discovered_devices:
-            rnode = RNodeDevice(device)
-            self.discovered_devices[device.address] = rnode
+        dd = self.discovered_devices
+        addr = device.address
+        if addr in dd:
+            return
+
+        rnode = RNodeDevice(device)
+        dd[addr] = rnode
+
+        logger.info("Discovered RNode: %s", rnode)
+
+        # Notify callbacks (single try around the whole dispatch)
+        cbs = self._callback_tuple
+        if not cbs:
+            return
+        try:
+            for callback in cbs:
+                callback(rnode)
+        except Exception:
+            logger.exception("Error in discovery callback")
 
-            logger.info(f"Discovered RNode: {rnode}")
+    def _load_service_cache(self) -> Dict[str, Dict]:
+        """Load persisted per-address service info from disk"""
+        try:
+            with open(self.SERVICE_CACHE_PATH) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-            # Notify callbacks
-            for callback in self.scan_callbacks:
-                try:
-                    callback(rnode)
-                except Exception as e:
-                    logger.error(f"Error in discovery callback: {e}")
+    def _save_service_cache(self):
+        """Persist per-address service info to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.SERVICE_CACHE_PATH), exist_ok=True)
+            with open(self.SERVICE_CACHE_PATH, 'w') as f:
+                json.dump(self._service_cache, f)
+        except OSError as e:
+            logger.debug("Could not save service cache: %s", e)
+
+    def is_known(self, address: str) -> bool:
+        """Check whether a device was verified on a previous run"""
+        cached = self._service_cache.get(address)
+        return bool(cached and cached.get('verified'))
+
+    def record_known_device(self, address: str, rx_uuid: str, tx_uuid: str):
+        """Persist a successfully connected device's characteristics"""
+        self._service_cache[address] = {
+            'rx_uuid': rx_uuid,
+            'tx_uuid': tx_uuid,
+            'verified': True
+        }
+        self._save_service_cache()
+
+    async def _ensure_client(self, rnode: RNodeDevice) -> BleakClient:
+        """Get a connected BleakClient for a device, reusing cached connections"""
+        client = self._client_cache.get(rnode.address)
+        if client and client.is_connected:
+            return client
+
+        client = BleakClient(rnode.device)
+
+        # On BlueZ, reuse the cached remote GATT database to skip
+        # re-discovery on devices we've already talked to
+        if platform.system() == "Linux":
+            await client.connect(dangerous_use_bleak_cache=True)
+        else:
+            await client.connect()
+
+        self._client_cache[rnode.address] = client
+        return client
+
+    async def close_cached_clients(self):
+        """Disconnect and drop any cached BleakClient connections"""
+        for address, client in list(self._client_cache.items()):
+            try:
+                if client.is_connected:
+                    await client.disconnect()
+            except Exception as e:
+                logger.debug("Error disconnecting cached client %s: %s", address, e)
+        self._client_cache.clear()
 
     async def get_device_info(self, rnode: RNodeDevice) -> Dict:
         """Get detailed information about an RNode device"""
@@ -129,84 +325,117 @@ class BLEDiscovery:
         }
 
         try:
-            async with BleakClient(rnode.device) as client:
-                logger.info(f"Connected to {rnode} for info gathering")
-
-                # Get services
-                for service in client.services:
-                    service_info = {
-                        'uuid': service.uuid,
-                        'description': service.description
-                    }
-                    info['services'].append(service_info)
-
-                    # Get characteristics for Nordic UART service
-                    if service.uuid.lower() == self.NORDIC_UART_SERVICE_UUID.lower():
-                        info['characteristics']['nordic_uart'] = []
-                        for char in service.characteristics:
-                            char_info = {
-                                'uuid': char.uuid,
-                                'properties': char.properties,
-                                'description': char.description
-                            }
-                            info['characteristics']['nordic_uart'].append(char_info)
+            client = await self._ensure_client(rnode)
+            logger.info("Connected to %s for info gathering", rnode)
+
+            # Get services
+            for service in client.services:
+                service_info = {
+                    'uuid': service.uuid,
+                    'description': service.description
+                }
+                info['services'].append(service_info)
+
+                # Get characteristics for Nordic UART service
+                if service.uuid.lower() == self._NORDIC_UART_SERVICE_UUID_LC:
+                    info['characteristics']['nordic_uart'] = []
+                    for char in service.characteristics:
+                        char_info = {
+                            'uuid': char.uuid,
+                            'properties': char.properties,
+                            'description': char.description
+                        }
+                        info['characteristics']['nordic_uart'].append(char_info)
 
         except Exception as e:
-            logger.error(f"Error getting device info for {rnode}: {e}")
+            logger.error("Error getting device info for %s: %s", rnode, e)
             info['error'] = str(e)
 
         return info
 
     async def verify_rnode_compatibility(self, rnode: RNodeDevice) -> bool:
         """Verify that device supports required Nordic UART characteristics"""
-        try:
-            async with BleakClient(rnode.device) as client:
-                logger.info(f"Verifying compatibility for {rnode}")
-
-                # Look for Nordic UART service
-                service = client.services.get_service(self.NORDIC_UART_SERVICE_UUID)
-                if not service:
-                    logger.warning(f"No Nordic UART service found on {rnode}")
-                    return False
-
-                # Check for required characteristics
-                rx_char = None
-                tx_char = None
-
-                for char in service.characteristics:
-                    if char.uuid.lower() == self.NORDIC_UART_RX_UUID.lower():
-                        rx_char = char
-                    elif char.uuid.lower() == self.NORDIC_UART_TX_UUID.lower():
-                        tx_char = char
+        # Devices verified on a previous run don't need another
+        # connect + service discovery round-trip
+        cached = self._service_cache.get(rnode.address)
+        if cached and cached.get('verified'):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Using cached compatibility for %s", rnode)
+            return True
 
-                if not rx_char:
-                    logger.warning(f"No RX characteristic found on {rnode}")
-                    return False
+        try:
+            client = await self._ensure_client(rnode)
+            logger.info("Verifying compatibility for %s", rnode)
+
+            # Look for Nordic UART service
+            service = client.services.get_service(self.NORDIC_UART_SERVICE_UUID)
+            if not service:
+                logger.warning("No Nordic UART service found on %s", rnode)
+                return False
+
+            # Check for required characteristics
+            rx_char = None
+            tx_char = None
+
+            for char in service.characteristics:
+                if char.uuid.lower() == self._NORDIC_UART_RX_UUID_LC:
+                    rx_char = char
+                elif char.uuid.lower() == self._NORDIC_UART_TX_UUID_LC:
+                    tx_char = char
+
+            if not rx_char:
+                logger.warning("No RX characteristic found on %s", rnode)
+                return False
+
+            if not tx_char:
+                logger.warning("No TX characteristic found on %s", rnode)
+                return False
+
+            # Check properties
+            if "write" not in rx_char.properties and "write-without-response" not in rx_char.properties:
+                logger.warning("RX characteristic on %s doesn't support write", rnode)
+                return False
+
+            if "notify" not in tx_char.properties and "read" not in tx_char.properties:
+                logger.warning("TX characteristic on %s doesn't support notify/read", rnode)
+                return False
+
+            logger.info("RNode %s is compatible", rnode)
+
+            # Remember the verified characteristics for future runs
+            self._service_cache[rnode.address] = {
+                'rx_uuid': rx_char.uuid,
+                'tx_uuid': tx_char.uuid,
+                'verified': True
+            }
+            self._save_service_cache()
+
+            return True
 
-                if not tx_char:
-                    logger.warning(f"No TX characteristic found on {rnode}")
-                    return False
+        except Exception as e:
+            logger.error("Error verifying compatibility for %s: %s", rnode, e)
+            return False
 
-                # Check properties
-                if "write" not in rx_char.properties and "write-without-response" not in rx_char.properties:
-                    logger.warning(f"RX characteristic on {rnode} doesn't support write")
-                    return False
+    async def verify_all(self, rnodes: List[RNodeDevice],
+                         max_concurrent: int = 4) -> Dict[str, bool]:
+        """Verify compatibility of several devices concurrently"""
+        sem = asyncio.Semaphore(max_concurrent)
 
-                if "notify" not in tx_char.properties and "read" not in tx_char.properties:
-                    logger.warning(f"TX characteristic on {rnode} doesn't support notify/read")
-                    return False
+        async def _one(rnode: RNodeDevice):
+            async with sem:
+                return rnode.address, await self.verify_rnode_compatibility(rnode)
 
-                logger.info(f"RNode {rnode} is compatible")
-                return True
-
-        except Exception as e:
-            logger.error(f"Error verifying compatibility for {rnode}: {e}")
-            return False
+        pairs = await asyncio.gather(*(_one(rnode) for rnode in rnodes))
+        return dict(pairs)
 
     def get_discovered_devices(self) -> List[RNodeDevice]:
         """Get list of currently discovered devices"""
         return list(self.discovered_devices.values())
 
+    def iter_discovered(self):
+        """Iterate discovered devices without copying into a list"""
+        return iter(self.discovered_devices.values())
+
     def get_device_by_address(self, address: str) -> Optional[RNodeDevice]:
         """Get device by Bluetooth address"""
         return self.discovered_devices.get(address)
\ No newline at end of file
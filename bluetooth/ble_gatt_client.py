@@ -2,9 +2,9 @@
 
 import asyncio
 import logging
+import re
+from collections import deque
 from typing import Optional, Callable, Any
-import threading
-from queue import Queue, Empty
 
 try:
     from bleak import BleakClient
@@ -18,6 +18,9 @@ from .ble_pairing import pairing_manager, BLEAuthHandler
 
 logger = logging.getLogger(__name__)
 
+# Pairing/authentication failure keywords, matched in one pass
+_PAIRING_ERR_RE = re.compile(r"not paired|authentication|bonding|security", re.IGNORECASE)
+
 class BLEGATTClient:
     """BLE GATT client for communicating with RNode devices"""
 
@@ -26,17 +29,37 @@ class BLEGATTClient:
     NORDIC_UART_RX_UUID = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"  # Write to RNode
     NORDIC_UART_TX_UUID = "6e400003-b5a3-f393-e0a9-e50e24dcca9e"  # Read from RNode
 
-    def __init__(self, rnode: RNodeDevice):
+    # Precomputed lowercase forms for characteristic lookups
+    _NUS_RX_LOWER = NORDIC_UART_RX_UUID.lower()
+    _NUS_TX_LOWER = NORDIC_UART_TX_UUID.lower()
+
+    def __init__(self, rnode: RNodeDevice, chunk_size: Optional[int] = None):
         self.rnode = rnode
         self.client: Optional[BleakClient] = None
         self.is_connected = False
         self.is_connecting = False
 
-        # Data handling
-        self.rx_queue = Queue()  # Data received from RNode
-        self.tx_queue = Queue()  # Data to send to RNode
+        # ATT MTU negotiated at connect time; until then assume the BLE 4.0
+        # minimum (23 bytes, 20 usable)
+        self.requested_chunk_size = chunk_size
+        self.mtu = 23
+        self.max_chunk_size = 20
+        self._write_no_resp = False
+
+        # Data handling. The TX queue is bounded so a stalled link applies
+        # backpressure instead of accumulating outbound data without limit.
+        self.rx_queue: asyncio.Queue = asyncio.Queue()  # Data received from RNode
+        self.tx_queue: asyncio.Queue = asyncio.Queue(maxsize=256)  # Data to send to RNode
         self.data_callback: Optional[Callable[[bytes], None]] = None
 
+        # Loop the TX worker runs on; send_data may be called from other
+        # threads (e.g. the virtual serial read thread)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Pooled receive buffers, reused across notifications on the
+        # internal-queue path to avoid a fresh allocation per packet
+        self._rx_pool: deque = deque(bytearray(256) for _ in range(32))
+
         # Characteristics
         self.tx_characteristic: Optional[BleakGATTCharacteristic] = None
         self.rx_characteristic: Optional[BleakGATTCharacteristic] = None
@@ -51,12 +74,25 @@ class BLEGATTClient:
 
         # Background tasks
         self._tx_task: Optional[asyncio.Task] = None
-        self._connection_monitor_task: Optional[asyncio.Task] = None
+        self._rx_dispatch_task: Optional[asyncio.Task] = None
 
     def set_data_callback(self, callback: Callable[[bytes], None]):
         """Set callback for received data"""
         self.data_callback = callback
 
+        # Honor late registration: if we're already connected, make sure
+        # the drain task that delivers queued packets is running
+        if callback and self.is_connected and self._loop is not None:
+            try:
+                on_loop = asyncio.get_running_loop() is self._loop
+            except RuntimeError:
+                on_loop = False
+
+            if on_loop:
+                self._spawn_rx_dispatch()
+            else:
+                self._loop.call_soon_threadsafe(self._spawn_rx_dispatch)
+
     def set_connection_callbacks(self,
                                established: Optional[Callable[[], None]] = None,
                                lost: Optional[Callable[[], None]] = None,
@@ -76,24 +112,28 @@ class BLEGATTClient:
 
         logger.info(f"Connecting to RNode {self.rnode}")
         self.is_connecting = True
+        self._loop = asyncio.get_running_loop()
 
         try:
             # Check pairing status first
             pairing_status = await pairing_manager.check_pairing_status(self.rnode.address)
             logger.info(f"Pairing status for {self.rnode}: {pairing_status}")
 
-            # Create client
-            self.client = BleakClient(
-                self.rnode.device,
-                disconnected_callback=self._on_disconnect
-            )
+            # Create client (reused across reconnects), restricting service
+            # discovery to the Nordic UART service so reconnects don't
+            # re-walk the device's whole GATT database
+            if self.client is None:
+                self.client = BleakClient(
+                    self.rnode.device,
+                    disconnected_callback=self._on_disconnect,
+                    services=[self.NORDIC_UART_SERVICE_UUID]
+                )
 
             # Attempt connection
             try:
                 await asyncio.wait_for(self.client.connect(), timeout=timeout)
             except Exception as e:
-                error_msg = str(e).lower()
-                if any(keyword in error_msg for keyword in ["not paired", "authentication", "bonding", "security"]):
+                if _PAIRING_ERR_RE.search(str(e)):
                     logger.warning(f"Connection failed due to pairing/authentication: {e}")
                     if self.pairing_callback:
                         self.pairing_callback("pairing_required", str(e))
@@ -153,15 +193,9 @@ class BLEGATTClient:
         if not service:
             raise BleakError("Nordic UART service not found")
 
-        # Find characteristics
-        self.rx_characteristic = None
-        self.tx_characteristic = None
-
-        for char in service.characteristics:
-            if char.uuid.lower() == self.NORDIC_UART_RX_UUID.lower():
-                self.rx_characteristic = char
-            elif char.uuid.lower() == self.NORDIC_UART_TX_UUID.lower():
-                self.tx_characteristic = char
+        # Find characteristics via the service's indexed lookup
+        self.rx_characteristic = service.get_characteristic(self._NUS_RX_LOWER)
+        self.tx_characteristic = service.get_characteristic(self._NUS_TX_LOWER)
 
         if not self.rx_characteristic:
             raise BleakError("RX characteristic not found")
@@ -169,18 +203,47 @@ class BLEGATTClient:
         if not self.tx_characteristic:
             raise BleakError("TX characteristic not found")
 
+        # Negotiate the largest usable ATT payload. BlueZ only learns the
+        # MTU after an explicit exchange; other backends negotiate during
+        # connect and just expose mtu_size.
+        acquire_mtu = getattr(getattr(self.client, '_backend', None), '_acquire_mtu', None)
+        if acquire_mtu:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                logger.debug(f"MTU exchange failed (using default): {e}")
+
+        # Prefer Write-Without-Response: it skips the per-write ACK
+        # round-trip, and the backend still flow-controls the link
+        self._write_no_resp = "write-without-response" in self.rx_characteristic.properties
+
+        self.mtu = getattr(self.client, 'mtu_size', 23) or 23
+        chunk_size = max(20, self.mtu - 3)  # 3 bytes of ATT header per write
+        if self.requested_chunk_size:
+            chunk_size = min(chunk_size, self.requested_chunk_size)
+        self.max_chunk_size = chunk_size
+
         # Enable notifications on TX characteristic (data from RNode)
         await self.client.start_notify(self.tx_characteristic, self._on_data_received)
 
-        logger.info(f"Characteristics setup complete for {self.rnode}")
+        logger.info(f"Characteristics setup complete for {self.rnode} "
+                    f"(MTU {self.mtu}, chunk size {self.max_chunk_size})")
 
     async def _start_background_tasks(self):
-        """Start background tasks for data transmission and connection monitoring"""
-        # Start TX task for sending queued data
+        """Start background tasks for data transmission"""
+        # Start TX task for sending queued data. Disconnects are delivered
+        # by bleak's disconnected_callback, so no polling monitor is needed.
         self._tx_task = asyncio.create_task(self._tx_worker())
 
-        # Start connection monitor
-        self._connection_monitor_task = asyncio.create_task(self._connection_monitor())
+        # When a data callback is registered, run it from a dedicated
+        # drain task so notify handling never blocks on consumer work
+        if self.data_callback:
+            self._spawn_rx_dispatch()
+
+    def _spawn_rx_dispatch(self):
+        """Start the RX drain task if it isn't already running"""
+        if self._rx_dispatch_task is None or self._rx_dispatch_task.done():
+            self._rx_dispatch_task = asyncio.create_task(self._rx_dispatch_worker())
 
     async def _tx_worker(self):
         """Background task to send queued data to RNode"""
@@ -188,79 +251,127 @@ class BLEGATTClient:
 
         while self.is_connected:
             try:
-                # Get data from queue (non-blocking)
+                # Park until data arrives; no polling interval
+                data = await self.tx_queue.get()
+
+                # Coalesce whatever else is already queued into one buffer,
+                # capped at a few MTUs to bound per-write latency
+                buf = bytearray(data)
                 try:
-                    data = self.tx_queue.get_nowait()
-                except Empty:
-                    await asyncio.sleep(0.01)  # Small delay to prevent busy loop
-                    continue
+                    while len(buf) < self.max_chunk_size * 4:
+                        buf.extend(self.tx_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    pass
+                data = bytes(buf)
 
                 # Send data to RNode
                 if self.client and self.rx_characteristic:
                     try:
-                        # Split large data into chunks if needed (BLE has MTU limits)
-                        max_chunk_size = 20  # Conservative MTU size
-
-                        for i in range(0, len(data), max_chunk_size):
-                            chunk = data[i:i + max_chunk_size]
-                            await self.client.write_gatt_char(self.rx_characteristic, chunk)
-                            await asyncio.sleep(0.01)  # Small delay between chunks
+                        max_chunk_size = self.max_chunk_size
+                        use_response = not self._write_no_resp
+
+                        if len(data) <= max_chunk_size:
+                            # Common case: the payload fits in one ATT write,
+                            # so skip the fragmentation loop entirely
+                            await self._write_chunk(data, use_response)
+                        else:
+                            # Split large data into chunks (BLE has MTU
+                            # limits); memoryview windows avoid copying a
+                            # fresh bytes object per fragment
+                            mv = memoryview(data)
+                            for i in range(0, len(data), max_chunk_size):
+                                chunk = mv[i:i + max_chunk_size]
+                                await self._write_chunk(chunk, use_response)
+                                # Yield once so other tasks can run, without
+                                # imposing an arbitrary inter-chunk delay
+                                await asyncio.sleep(0)
 
                         logger.debug(f"Sent {len(data)} bytes to {self.rnode}")
 
                     except Exception as e:
                         logger.error(f"Error sending data to {self.rnode}: {e}")
-                        # Re-queue the data for retry
-                        self.tx_queue.put(data)
+                        # Re-queue the data for retry; if the queue has
+                        # filled in the meantime, drop rather than block
+                        try:
+                            self.tx_queue.put_nowait(data)
+                        except asyncio.QueueFull:
+                            logger.warning(f"TX queue full, dropping {len(data)} bytes for {self.rnode}")
                         await asyncio.sleep(0.1)
 
-                self.tx_queue.task_done()
-
             except Exception as e:
                 logger.error(f"TX worker error for {self.rnode}: {e}")
                 await asyncio.sleep(0.1)
 
         logger.debug(f"TX worker stopped for {self.rnode}")
 
-    async def _connection_monitor(self):
-        """Monitor connection health"""
-        logger.debug(f"Connection monitor started for {self.rnode}")
-
+    async def _write_chunk(self, chunk: bytes, use_response: bool):
+        """Write one ATT payload, yielding and retrying on backend backpressure"""
         while self.is_connected:
             try:
-                if not self.client or not self.client.is_connected:
-                    logger.warning(f"Connection lost to {self.rnode}")
-                    await self._handle_connection_lost()
-                    break
-
-                await asyncio.sleep(1)  # Check every second
-
-            except Exception as e:
-                logger.error(f"Connection monitor error for {self.rnode}: {e}")
-                await asyncio.sleep(1)
-
-        logger.debug(f"Connection monitor stopped for {self.rnode}")
+                await self.client.write_gatt_char(
+                    self.rx_characteristic, chunk, response=use_response
+                )
+                return
+            except BlockingIOError:
+                # The unacknowledged write path is full (e.g. BlueZ EAGAIN
+                # on the acquired socket); yield to the loop and retry
+                await asyncio.sleep(0)
 
     def _on_data_received(self, sender: BleakGATTCharacteristic, data: bytearray):
         """Callback for data received from RNode"""
         try:
-            data_bytes = bytes(data)
-            logger.debug(f"Received {len(data_bytes)} bytes from {self.rnode}")
+            logger.debug(f"Received {len(data)} bytes from {self.rnode}")
 
-            # Add to receive queue
-            self.rx_queue.put(data_bytes)
-
-            # Call data callback if set
             if self.data_callback:
-                self.data_callback(data_bytes)
+                # External consumer with unknown lifetime: hand an immutable
+                # copy to the dispatch worker rather than a pooled buffer
+                self.rx_queue.put_nowait(bytes(data))
+                return
+
+            # Internal-queue path: reuse a pooled buffer instead of
+            # allocating per notification
+            try:
+                buf = self._rx_pool.popleft()
+            except IndexError:
+                buf = bytearray()
+            buf[:] = data
+            self.rx_queue.put_nowait(buf)
 
         except Exception as e:
             logger.error(f"Error processing received data from {self.rnode}: {e}")
 
+    async def _rx_dispatch_worker(self):
+        """Run the data callback off the notify hot path"""
+        logger.debug(f"RX dispatch worker started for {self.rnode}")
+
+        while self.is_connected:
+            try:
+                data = await self.rx_queue.get()
+                cb = self.data_callback
+                if cb is None:
+                    continue
+
+                # Drain everything already queued before yielding back
+                cb(data)
+                while not self.rx_queue.empty():
+                    cb(self.rx_queue.get_nowait())
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"RX dispatch error for {self.rnode}: {e}")
+
+        logger.debug(f"RX dispatch worker stopped for {self.rnode}")
+
     def _on_disconnect(self, client: BleakClient):
         """Callback for unexpected disconnection"""
         logger.warning(f"Unexpected disconnection from {self.rnode}")
-        asyncio.create_task(self._handle_connection_lost())
+        # Schedule on the connect-time loop; this callback may not run in a
+        # context where asyncio.create_task can find a running loop
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(
+                self._loop.create_task, self._handle_connection_lost()
+            )
 
     async def _handle_connection_lost(self):
         """Handle connection loss"""
@@ -286,12 +397,13 @@ class BLEGATTClient:
             except asyncio.CancelledError:
                 pass
 
-        if self._connection_monitor_task:
-            self._connection_monitor_task.cancel()
+        if self._rx_dispatch_task:
+            self._rx_dispatch_task.cancel()
             try:
-                await self._connection_monitor_task
+                await self._rx_dispatch_task
             except asyncio.CancelledError:
                 pass
+            self._rx_dispatch_task = None
 
         # Stop notifications
         if self.client and self.tx_characteristic:
@@ -305,26 +417,53 @@ class BLEGATTClient:
         self.rx_characteristic = None
 
     def send_data(self, data: bytes) -> bool:
-        """Queue data to send to RNode"""
+        """Queue data to send to RNode (safe to call from any thread)"""
         if not self.is_connected:
             logger.warning(f"Cannot send data - not connected to {self.rnode}")
             return False
 
         try:
-            self.tx_queue.put(data)
+            # Enqueue directly when already on the loop thread; only other
+            # threads need the call_soon_threadsafe handoff
+            loop = self._loop
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            if loop is None or running is loop:
+                self._tx_put(data)
+            else:
+                loop.call_soon_threadsafe(self._tx_put, data)
             logger.debug(f"Queued {len(data)} bytes for {self.rnode}")
             return True
         except Exception as e:
             logger.error(f"Error queuing data for {self.rnode}: {e}")
             return False
 
-    def receive_data(self, timeout: float = 0.1) -> Optional[bytes]:
-        """Get received data from queue"""
+    def _tx_put(self, data: bytes):
+        """Enqueue outbound data, dropping when the bounded queue is full"""
         try:
-            return self.rx_queue.get(timeout=timeout)
-        except Empty:
+            self.tx_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning(f"TX queue full, dropping {len(data)} bytes for {self.rnode}")
+
+    async def receive_data(self, timeout: float = 0.1) -> Optional[bytes]:
+        """Get received data from queue.
+
+        When no data callback is set the returned object may be a pooled
+        bytearray; pass it back via release_buffer when done to recycle it.
+        """
+        try:
+            return await asyncio.wait_for(self.rx_queue.get(), timeout)
+        except asyncio.TimeoutError:
             return None
 
+    def release_buffer(self, buf):
+        """Return a buffer obtained from receive_data to the pool"""
+        if isinstance(buf, bytearray) and len(self._rx_pool) < 32:
+            self._rx_pool.append(buf)
+
     def get_connection_info(self) -> dict:
         """Get connection information"""
         info = {
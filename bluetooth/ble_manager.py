@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional
 import json
 
@@ -20,17 +21,17 @@ class BLEManager:
         self.bridge = BLESerialBridge()
         self.is_started = False
 
-        # Event callbacks for web API
-        self.event_callbacks = []
+        # Event callbacks for web API, kept as an immutable tuple so emits
+        # iterate it directly without locking against add/remove
+        self.event_callbacks: tuple = ()
 
     def add_event_callback(self, callback):
         """Add callback for bridge events"""
-        self.event_callbacks.append(callback)
+        self.event_callbacks = self.event_callbacks + (callback,)
 
     def remove_event_callback(self, callback):
         """Remove event callback"""
-        if callback in self.event_callbacks:
-            self.event_callbacks.remove(callback)
+        self.event_callbacks = tuple(c for c in self.event_callbacks if c is not callback)
 
     async def start(self) -> bool:
         """Start the BLE manager"""
@@ -123,6 +124,16 @@ class BLEManager:
         """Get list of connected devices"""
         return self.bridge.get_connected_devices()
 
+    def iter_connected_devices(self):
+        """Iterate connected device info without materializing a list"""
+        for bridge in self.bridge.bridges.values():
+            if bridge.state is BridgeState.CONNECTED:
+                yield self.bridge._bridge_to_dict(bridge)
+
+    def get_device_info(self, address: str) -> Optional[Dict]:
+        """Get connection info for one device by address"""
+        return self.bridge.get_device_info(address)
+
     def get_discovered_devices(self) -> List[Dict]:
         """Get list of discovered (but not necessarily connected) devices"""
         devices = self.bridge.discovery.get_discovered_devices()
@@ -156,12 +167,9 @@ class BLEManager:
 
     def _device_to_dict(self, device: RNodeDevice) -> Dict:
         """Convert RNodeDevice to dictionary"""
-        return {
-            'name': device.name,
-            'address': device.address,
-            'rssi': device.rssi,
-            'is_connected': device.is_connected
-        }
+        # The device caches its dict form, so repeated events and multiple
+        # subscribers share one snapshot instead of re-serializing
+        return device.as_dict
 
     def _on_device_discovered(self, device: RNodeDevice):
         """Handle device discovery"""
@@ -180,10 +188,10 @@ class BLEManager:
             'state': state.value
         })
 
-        # If connected, emit virtual serial port info
-        if state == BridgeState.CONNECTED:
-            connected_devices = self.get_connected_devices()
-            device_info = next((d for d in connected_devices if d['address'] == address), None)
+        # If connected, emit virtual serial port info — but only bother
+        # building it when someone is subscribed
+        if state is BridgeState.CONNECTED and self.event_callbacks:
+            device_info = self.get_device_info(address)
             if device_info:
                 self._emit_event('virtual_serial_created', {
                     'address': address,
@@ -193,13 +201,18 @@ class BLEManager:
 
     def _emit_event(self, event_type: str, data: Dict):
         """Emit event to all registered callbacks"""
+        # Skip event construction entirely when nobody is listening
+        cbs = self.event_callbacks
+        if not cbs:
+            return
+
         event = {
             'type': event_type,
             'data': data,
-            'timestamp': asyncio.get_event_loop().time()
+            'timestamp': time.monotonic()
         }
 
-        for callback in self.event_callbacks:
+        for callback in cbs:
             try:
                 callback(event)
             except Exception as e:
@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import re
+import time
 from typing import Optional, Callable, Dict
 import platform
 
@@ -12,15 +14,72 @@ try:
 except ImportError:
     raise ImportError("bleak library required: pip install bleak")
 
+# dbus-fast ships with bleak on Linux; used for direct BlueZ pairing
+# without spawning bluetoothctl subprocesses
+try:
+    from dbus_fast import Variant
+    from dbus_fast.aio import MessageBus
+    from dbus_fast.constants import BusType
+except ImportError:
+    MessageBus = None
+
 logger = logging.getLogger(__name__)
 
+# Platform name never changes at runtime; avoid re-querying per call
+_SYSTEM = platform.system()
+
+# Error markers that indicate a device is unpaired, matched in one pass
+_UNPAIRED_RE = re.compile(r"not paired|authentication|not authenticated", re.IGNORECASE)
+
+# Static pairing-instruction templates, built once at import. The Linux
+# steps format the device address in when requested.
+_MACOS_INSTRUCTIONS = {
+    "platform": "macOS",
+    "title": "Pair RNode Device",
+    "instructions": [
+        "1. Open System Preferences → Bluetooth",
+        "2. Make sure your RNode is in pairing mode",
+        "3. Click 'Connect' when the RNode appears",
+        "4. Enter the PIN when prompted",
+        "5. Return to MeshChat and try connecting again"
+    ],
+    "notes": "The PIN is usually displayed on the RNode or is a default like '123456'"
+}
+
+_LINUX_INSTRUCTION_STEPS = (
+    "1. Open a terminal",
+    "2. Run: bluetoothctl",
+    "3. Run: scan on",
+    "4. Run: pair {address}",
+    "5. Enter PIN when prompted",
+    "6. Run: trust {address}",
+    "7. Return to MeshChat and try connecting"
+)
+
+_GENERIC_INSTRUCTIONS = {
+    "platform": _SYSTEM,
+    "title": "Manual Pairing Required",
+    "instructions": [
+        "1. Use your system's Bluetooth settings",
+        "2. Pair with the RNode device",
+        "3. Enter the PIN when prompted",
+        "4. Return to MeshChat and try connecting"
+    ],
+    "notes": "Automatic pairing not implemented for this platform"
+}
+
 class BLEPairingManager:
     """Manages BLE pairing and authentication for RNode devices"""
 
+    __slots__ = ('pairing_callbacks', 'pairing_state', 'stored_pins',
+                 '_stored_pin_ints', '_status_cache')
+
     def __init__(self):
         self.pairing_callbacks: Dict[str, Callable] = {}
         self.pairing_state: Dict[str, str] = {}  # address -> state
         self.stored_pins: Dict[str, str] = {}    # address -> pin
+        self._stored_pin_ints: Dict[str, int] = {}  # address -> pre-parsed pin
+        self._status_cache: Dict[str, tuple] = {}  # address -> (status, expiry)
 
     def set_pairing_callback(self, device_address: str, callback: Callable[[str, str], None]):
         """Set callback for pairing events (device_address, event_type, data)"""
@@ -29,16 +88,27 @@ class BLEPairingManager:
     def store_pin_for_device(self, device_address: str, pin: str):
         """Store PIN for a device (for automatic pairing)"""
         self.stored_pins[device_address] = pin
+        # Pre-parse so passkey callbacks never need int() conversion
+        try:
+            self._stored_pin_ints[device_address] = int(pin)
+        except ValueError:
+            logger.warning(f"Invalid stored PIN format: {pin}")
+            self._stored_pin_ints.pop(device_address, None)
         logger.info(f"Stored PIN for device {device_address}")
 
     def get_stored_pin(self, device_address: str) -> Optional[str]:
         """Get stored PIN for a device"""
         return self.stored_pins.get(device_address)
 
+    def get_stored_pin_int(self, device_address: str) -> Optional[int]:
+        """Get the pre-parsed numeric PIN for a device"""
+        return self._stored_pin_ints.get(device_address)
+
     def clear_stored_pin(self, device_address: str):
         """Clear stored PIN for a device"""
         if device_address in self.stored_pins:
             del self.stored_pins[device_address]
+        self._stored_pin_ints.pop(device_address, None)
 
     async def pair_with_pin(self, device_address: str, pin: str) -> bool:
         """Attempt to pair with device using provided PIN"""
@@ -49,12 +119,12 @@ class BLEPairingManager:
             self.store_pin_for_device(device_address, pin)
 
             # Platform-specific pairing
-            if platform.system() == "Darwin":  # macOS
+            if _SYSTEM == "Darwin":  # macOS
                 success = await self._pair_macos(device_address, pin)
-            elif platform.system() == "Linux":
+            elif _SYSTEM == "Linux":
                 success = await self._pair_linux(device_address, pin)
             else:
-                logger.warning(f"Pairing not implemented for {platform.system()}")
+                logger.warning(f"Pairing not implemented for {_SYSTEM}")
                 success = False
 
             if success:
@@ -79,7 +149,6 @@ class BLEPairingManager:
 
         # Attempt connection which may trigger pairing dialog
         try:
-            from bleak import BleakClient
             async with BleakClient(device_address) as client:
                 # Connection attempt may trigger pairing
                 await client.connect()
@@ -90,27 +159,67 @@ class BLEPairingManager:
             return False
 
     async def _pair_linux(self, device_address: str, pin: str) -> bool:
-        """Handle pairing on Linux using bluetoothctl"""
+        """Handle pairing on Linux via BlueZ D-Bus, with bluetoothctl fallback"""
+        if MessageBus is not None:
+            try:
+                return await asyncio.wait_for(
+                    self._pair_linux_dbus(device_address), timeout=30.0
+                )
+            except Exception as e:
+                logger.warning(f"D-Bus pairing failed for {device_address}, "
+                               f"falling back to bluetoothctl: {e}")
+
+        return await self._pair_linux_bluetoothctl(device_address, pin)
+
+    async def _pair_linux_dbus(self, device_address: str) -> bool:
+        """Pair and trust a device directly through the BlueZ D-Bus API"""
+        device_path = f"/org/bluez/hci0/dev_{device_address.replace(':', '_').upper()}"
+
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
         try:
-            import subprocess
+            introspection = await bus.introspect("org.bluez", device_path)
+            proxy = bus.get_proxy_object("org.bluez", device_path, introspection)
+            device = proxy.get_interface("org.bluez.Device1")
+            props = proxy.get_interface("org.freedesktop.DBus.Properties")
+
+            paired = await props.call_get("org.bluez.Device1", "Paired")
+            if not getattr(paired, 'value', paired):
+                await device.call_pair()
+
+            # Mark as trusted so future connections skip authorization
+            await props.call_set("org.bluez.Device1", "Trusted", Variant('b', True))
+            return True
+        finally:
+            bus.disconnect()
 
-            # Use bluetoothctl for pairing
+    async def _pair_linux_bluetoothctl(self, device_address: str, pin: str) -> bool:
+        """Handle pairing on Linux using bluetoothctl"""
+        try:
+            # Async subprocesses so a slow bluetoothctl doesn't stall the
+            # event loop (and every other bridge) for up to 30s
             commands = [
-                f"bluetoothctl pair {device_address}",
-                f"bluetoothctl trust {device_address}"
+                ("bluetoothctl", "pair", device_address),
+                ("bluetoothctl", "trust", device_address)
             ]
 
-            for cmd in commands:
-                logger.info(f"Running: {cmd}")
-                result = subprocess.run(
-                    cmd.split(),
-                    capture_output=True,
-                    text=True,
-                    timeout=30
+            for argv in commands:
+                logger.info(f"Running: {' '.join(argv)}")
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
 
-                if result.returncode != 0:
-                    logger.warning(f"Command failed: {result.stderr}")
+                try:
+                    out, err = await asyncio.wait_for(proc.communicate(), timeout=30.0)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.communicate()
+                    logger.warning(f"Command timed out: {' '.join(argv)}")
+                    return False
+
+                if proc.returncode != 0:
+                    logger.warning(f"Command failed: {err.decode(errors='replace')}")
                     return False
 
             return True
@@ -121,54 +230,62 @@ class BLEPairingManager:
 
     def get_pairing_instructions(self, device_address: str) -> Dict[str, str]:
         """Get platform-specific pairing instructions"""
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            return {
-                "platform": "macOS",
-                "title": "Pair RNode Device",
-                "instructions": [
-                    "1. Open System Preferences → Bluetooth",
-                    "2. Make sure your RNode is in pairing mode",
-                    "3. Click 'Connect' when the RNode appears",
-                    "4. Enter the PIN when prompted",
-                    "5. Return to MeshChat and try connecting again"
-                ],
-                "notes": "The PIN is usually displayed on the RNode or is a default like '123456'"
-            }
-        elif system == "Linux":
+        if _SYSTEM == "Darwin":  # macOS
+            return _MACOS_INSTRUCTIONS
+        elif _SYSTEM == "Linux":
             return {
                 "platform": "Linux",
                 "title": "Pair RNode Device",
                 "instructions": [
-                    "1. Open a terminal",
-                    "2. Run: bluetoothctl",
-                    "3. Run: scan on",
-                    "4. Run: pair " + device_address,
-                    "5. Enter PIN when prompted",
-                    "6. Run: trust " + device_address,
-                    "7. Return to MeshChat and try connecting"
+                    step.format(address=device_address)
+                    for step in _LINUX_INSTRUCTION_STEPS
                 ],
                 "notes": "You can also use your desktop's Bluetooth manager"
             }
         else:
-            return {
-                "platform": system,
-                "title": "Manual Pairing Required",
-                "instructions": [
-                    "1. Use your system's Bluetooth settings",
-                    "2. Pair with the RNode device",
-                    "3. Enter the PIN when prompted",
-                    "4. Return to MeshChat and try connecting"
-                ],
-                "notes": "Automatic pairing not implemented for this platform"
-            }
+            return _GENERIC_INSTRUCTIONS
 
     async def check_pairing_status(self, device_address: str) -> str:
         """Check if device is already paired"""
+        # Short TTL cache so back-to-back UI calls don't re-query
+        now = time.monotonic()
+        cached = self._status_cache.get(device_address)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        # On Linux, read the BlueZ Paired property directly — far cheaper
+        # than a connect probe and doesn't disturb a live GATT session
+        if _SYSTEM == "Linux" and MessageBus is not None:
+            try:
+                status = await self._check_pairing_status_dbus(device_address)
+                self._status_cache[device_address] = (status, now + 0.5)
+                return status
+            except Exception as e:
+                logger.debug(f"D-Bus pairing status check failed: {e}")
+
+        status = await self._check_pairing_status_probe(device_address)
+        self._status_cache[device_address] = (status, now + 0.5)
+        return status
+
+    async def _check_pairing_status_dbus(self, device_address: str) -> str:
+        """Read org.bluez.Device1.Paired for a device"""
+        device_path = f"/org/bluez/hci0/dev_{device_address.replace(':', '_').upper()}"
+
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        try:
+            introspection = await bus.introspect("org.bluez", device_path)
+            proxy = bus.get_proxy_object("org.bluez", device_path, introspection)
+            props = proxy.get_interface("org.freedesktop.DBus.Properties")
+
+            paired = await props.call_get("org.bluez.Device1", "Paired")
+            return "paired" if getattr(paired, 'value', paired) else "unpaired"
+        finally:
+            bus.disconnect()
+
+    async def _check_pairing_status_probe(self, device_address: str) -> str:
+        """Fallback: infer pairing state from a quick connection test"""
         try:
             # Try a quick connection test
-            from bleak import BleakClient
             client = BleakClient(device_address)
 
             try:
@@ -181,7 +298,7 @@ class BLEPairingManager:
             except asyncio.TimeoutError:
                 return "unpaired"
             except Exception as e:
-                if "not paired" in str(e).lower() or "authentication" in str(e).lower():
+                if _UNPAIRED_RE.search(str(e)):
                     return "unpaired"
                 else:
                     return "unknown"
@@ -193,15 +310,23 @@ class BLEPairingManager:
     def notify_pairing_event(self, device_address: str, event_type: str, data: str = ""):
         """Notify about pairing events"""
         callback = self.pairing_callbacks.get(device_address)
-        if callback:
-            try:
-                callback(event_type, data)
-            except Exception as e:
-                logger.error(f"Pairing callback error: {e}")
+        if callback is None:
+            return
+
+        try:
+            callback(event_type, data)
+        except Exception:
+            logger.exception("Pairing callback error")
 
 class BLEAuthHandler:
     """Handles BLE authentication callbacks during connection"""
 
+    __slots__ = ('pairing_manager', 'device_address', 'pending_pin')
+
+    # Common default PINs for RNode devices; only the first is usable per
+    # passkey request, so keep it cheap to reach
+    _DEFAULT_PINS = (123456, 0, 111111, 654321)
+
     def __init__(self, pairing_manager: BLEPairingManager, device_address: str):
         self.pairing_manager = pairing_manager
         self.device_address = device_address
@@ -211,23 +336,14 @@ class BLEAuthHandler:
         """Handle passkey request from device"""
         logger.info(f"Passkey requested for {self.device_address}")
 
-        # Try to get stored PIN
-        stored_pin = self.pairing_manager.get_stored_pin(self.device_address)
-        if stored_pin:
-            try:
-                return int(stored_pin)
-            except ValueError:
-                logger.warning(f"Invalid stored PIN format: {stored_pin}")
-
-        # Default PIN (common for RNode devices)
-        default_pins = ["123456", "000000", "111111", "654321"]
-        for pin in default_pins:
-            logger.info(f"Trying default PIN: {pin}")
-            return int(pin)
+        # Stored PIN is pre-parsed, so this callback does no conversion
+        stored_pin = self.pairing_manager.get_stored_pin_int(self.device_address)
+        if stored_pin is not None:
+            return stored_pin
 
-        # If no PIN available, return 0 (will likely fail)
-        logger.warning(f"No PIN available for {self.device_address}")
-        return 0
+        # Only one reply is possible per request; use the most common
+        # RNode default PIN
+        return self._DEFAULT_PINS[0]
 
     def on_passkey_notify(self, passkey: int):
         """Handle passkey notification (device shows PIN to user)"""
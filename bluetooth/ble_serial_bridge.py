@@ -11,8 +11,21 @@ from .ble_discovery import BLEDiscovery, RNodeDevice
 from .ble_gatt_client import BLEGATTClient
 from .virtual_serial import VirtualSerialPort
 
+# dbus-fast lets the monitor react to BlueZ PropertiesChanged signals
+# instead of polling; optional — we fall back to polling without it
+try:
+    from dbus_fast.aio import MessageBus
+    from dbus_fast.constants import BusType
+    from dbus_fast.message import Message
+except ImportError:
+    MessageBus = None
+
 logger = logging.getLogger(__name__)
 
+def _norm(address: str) -> str:
+    """Normalize a BLE address for use as a dict key"""
+    return address.upper()
+
 class BridgeState(Enum):
     """Bridge connection states"""
     DISCONNECTED = "disconnected"
@@ -27,6 +40,10 @@ class BLESerialBridge:
     Each RNode gets its own virtual serial port that MeshChat can connect to.
     """
 
+    # BlueZ serializes connect operations internally; queueing them here
+    # stops parallel attempts from burning each other's timeout budget
+    _connect_sem = asyncio.Semaphore(1)
+
     def __init__(self):
         self.discovery = BLEDiscovery()
         self.bridges: Dict[str, 'RNodeBridge'] = {}  # address -> RNodeBridge
@@ -40,6 +57,13 @@ class BLESerialBridge:
         self._discovery_task: Optional[asyncio.Task] = None
         self._monitor_task: Optional[asyncio.Task] = None
 
+        # Event-driven monitoring (set on disconnects instead of polling)
+        self._monitor_event: Optional[asyncio.Event] = None
+        self._dbus_bus = None
+
+        # Per-address locks so concurrent connects to one device can't race
+        self._create_locks: Dict[str, asyncio.Lock] = {}
+
     def set_device_discovered_callback(self, callback: Callable[[RNodeDevice], None]):
         """Set callback for when new RNode devices are discovered"""
         self.device_discovered_callback = callback
@@ -48,7 +72,8 @@ class BLESerialBridge:
         """Set callback for bridge state changes"""
         self.bridge_state_callback = callback
 
-    async def start(self, auto_discover: bool = True, discovery_interval: float = 30.0):
+    async def start(self, auto_discover: bool = True, discovery_interval: float = 30.0,
+                    max_parallel_connects: int = 1):
         """Start the BLE-to-Serial bridge service"""
         if self.is_running:
             logger.warning("Bridge service already running")
@@ -57,6 +82,9 @@ class BLESerialBridge:
         logger.info("Starting BLE-to-Serial bridge service")
         self.is_running = True
 
+        if max_parallel_connects != 1:
+            BLESerialBridge._connect_sem = asyncio.Semaphore(max_parallel_connects)
+
         # Set up discovery callback
         self.discovery.add_discovery_callback(self._on_device_discovered)
 
@@ -66,7 +94,10 @@ class BLESerialBridge:
                 self._discovery_worker(discovery_interval)
             )
 
-        # Start monitor task
+        # Start monitor task; subscribe to BlueZ disconnect signals so it
+        # can sleep until something actually happens
+        self._monitor_event = asyncio.Event()
+        await self._start_dbus_monitor()
         self._monitor_task = asyncio.create_task(self._monitor_worker())
 
         logger.info("BLE-to-Serial bridge service started")
@@ -95,6 +126,14 @@ class BLESerialBridge:
             except asyncio.CancelledError:
                 pass
 
+        # Drop the D-Bus subscription
+        if self._dbus_bus is not None:
+            try:
+                self._dbus_bus.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disconnecting D-Bus monitor: {e}")
+            self._dbus_bus = None
+
         # Disconnect all bridges
         await self._disconnect_all_bridges()
 
@@ -116,45 +155,62 @@ class BLESerialBridge:
 
     async def disconnect_device(self, device_address: str):
         """Disconnect from a specific RNode device"""
-        if device_address in self.bridges:
-            await self.bridges[device_address].disconnect()
-            del self.bridges[device_address]
+        addr = _norm(device_address)
+        if addr in self.bridges:
+            await self.bridges[addr].disconnect()
+            del self.bridges[addr]
 
     def get_connected_devices(self) -> List[Dict]:
         """Get list of connected devices and their virtual serial ports"""
-        devices = []
-        for bridge in self.bridges.values():
-            if bridge.state == BridgeState.CONNECTED:
-                devices.append({
-                    'device': str(bridge.rnode),
-                    'address': bridge.rnode.address,
-                    'serial_port': bridge.virtual_serial.get_device_path(),
-                    'symlink': bridge.virtual_serial.get_symlink_path(),
-                    'state': bridge.state.value
-                })
-        return devices
+        return [
+            self._bridge_to_dict(bridge)
+            for bridge in self.bridges.values()
+            if bridge.state is BridgeState.CONNECTED
+        ]
+
+    def get_device_info(self, address: str) -> Optional[Dict]:
+        """Get connection info for one device by address (O(1) lookup)"""
+        bridge = self.bridges.get(_norm(address))
+        if not bridge or bridge.state is not BridgeState.CONNECTED:
+            return None
+        return self._bridge_to_dict(bridge)
+
+    def _bridge_to_dict(self, bridge: 'RNodeBridge') -> Dict:
+        """Build the public device-info dict for a bridge"""
+        return {
+            'device': str(bridge.rnode),
+            'address': bridge.rnode.address,
+            'serial_port': bridge.virtual_serial.get_device_path(),
+            'symlink': bridge.virtual_serial.get_symlink_path(),
+            'state': bridge.state.value
+        }
 
     def get_bridge_info(self) -> Dict:
         """Get comprehensive bridge information"""
-        info = {
+        connected = sum(1 for b in self.bridges.values()
+                        if b.state is BridgeState.CONNECTED)
+
+        return {
             'is_running': self.is_running,
             'discovered_devices': len(self.discovery.get_discovered_devices()),
-            'connected_bridges': len([b for b in self.bridges.values() if b.state == BridgeState.CONNECTED]),
+            'connected_bridges': connected,
             'total_bridges': len(self.bridges),
-            'bridges': {}
+            'bridges': {addr: bridge.get_info() for addr, bridge in self.bridges.items()}
         }
 
-        for addr, bridge in self.bridges.items():
-            info['bridges'][addr] = bridge.get_info()
-
-        return info
-
     async def _discovery_worker(self, interval: float):
         """Background task for periodic device discovery"""
         logger.info(f"Discovery worker started (interval: {interval}s)")
 
         while self.is_running:
             try:
+                # Nobody is listening for new devices and everything we
+                # manage is connected — skip the radio work entirely
+                if (self.device_discovered_callback is None and self.bridges and
+                        all(b.state is BridgeState.CONNECTED for b in self.bridges.values())):
+                    await asyncio.sleep(interval)
+                    continue
+
                 logger.debug("Running periodic RNode discovery scan")
                 devices = await self.discovery.scan_for_rnodes(timeout=5.0)
 
@@ -171,20 +227,77 @@ class BLESerialBridge:
 
         logger.info("Discovery worker stopped")
 
+    async def _start_dbus_monitor(self):
+        """Subscribe to BlueZ PropertiesChanged signals for disconnect events"""
+        if MessageBus is None:
+            logger.debug("dbus-fast unavailable, monitor will poll")
+            return
+
+        try:
+            bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+            await bus.call(Message(
+                destination='org.freedesktop.DBus',
+                path='/org/freedesktop/DBus',
+                interface='org.freedesktop.DBus',
+                member='AddMatch',
+                signature='s',
+                body=["type='signal',"
+                      "interface='org.freedesktop.DBus.Properties',"
+                      "member='PropertiesChanged',"
+                      "arg0='org.bluez.Device1'"]
+            ))
+            bus.add_message_handler(self._on_dbus_properties_changed)
+            self._dbus_bus = bus
+            logger.debug("D-Bus disconnect monitoring active")
+
+        except Exception as e:
+            logger.debug(f"D-Bus monitor unavailable, falling back to polling: {e}")
+            self._dbus_bus = None
+
+    def _on_dbus_properties_changed(self, message):
+        """Wake the monitor when a bridged device reports Connected=False"""
+        if message.member != 'PropertiesChanged' or not message.body:
+            return
+
+        changed = message.body[1] if len(message.body) > 1 else {}
+        connected = changed.get('Connected')
+        if connected is None or getattr(connected, 'value', connected):
+            return
+
+        path = message.path or ''
+        for bridge in self.bridges.values():
+            if bridge.device_path == path:
+                logger.debug(f"D-Bus disconnect signal for {path}")
+                self._monitor_event.set()
+                return
+
     async def _monitor_worker(self):
         """Background task for monitoring bridge health"""
         logger.debug("Monitor worker started")
 
+        # With the D-Bus subscription we only need a slow heartbeat sweep;
+        # without it, keep the original 10s polling interval
+        check_interval = 10.0
+        heartbeat = check_interval * 3 if self._dbus_bus is not None else check_interval
+
         while self.is_running:
             try:
-                # Check bridge states and attempt reconnections
-                for addr, bridge in list(self.bridges.items()):
-                    if bridge.state == BridgeState.ERROR:
+                try:
+                    await asyncio.wait_for(self._monitor_event.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    pass
+                self._monitor_event.clear()
+
+                # Check bridge states and attempt reconnections; tuple
+                # snapshot (no over-allocation) since reconnect awaits and
+                # the dict may be mutated underneath us
+                for addr, bridge in tuple(self.bridges.items()):
+                    if bridge.state is BridgeState.ERROR:
                         logger.info(f"Attempting to reconnect bridge {addr}")
                         await bridge.reconnect()
 
-                await asyncio.sleep(10.0)  # Monitor every 10 seconds
-
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Monitor worker error: {e}")
                 await asyncio.sleep(5.0)
@@ -201,57 +314,108 @@ class BLESerialBridge:
 
     async def _create_bridge(self, device: RNodeDevice) -> bool:
         """Create a bridge for an RNode device"""
-        if device.address in self.bridges:
-            logger.warning(f"Bridge already exists for {device}")
-            return self.bridges[device.address].state == BridgeState.CONNECTED
+        addr = _norm(device.address)
+        lock = self._create_locks.setdefault(addr, asyncio.Lock())
 
-        logger.info(f"Creating bridge for {device}")
+        async with lock:
+            if addr in self.bridges:
+                logger.warning(f"Bridge already exists for {device}")
+                return self.bridges[addr].state is BridgeState.CONNECTED
 
-        try:
-            bridge = RNodeBridge(device, self._on_bridge_state_change)
-            self.bridges[device.address] = bridge
+            logger.info(f"Creating bridge for {device}")
+
+            try:
+                bridge = RNodeBridge(device, self._on_bridge_state_change)
+                self.bridges[addr] = bridge
 
-            success = await bridge.connect()
-            return success
+                success = await bridge.connect()
 
-        except Exception as e:
-            logger.error(f"Failed to create bridge for {device}: {e}")
-            if device.address in self.bridges:
-                del self.bridges[device.address]
-            return False
+                # Remember the device's characteristics so future runs can
+                # treat it as known-good without re-verifying
+                if success:
+                    client = bridge.ble_client
+                    if client.rx_characteristic and client.tx_characteristic:
+                        self.discovery.record_known_device(
+                            device.address,
+                            client.rx_characteristic.uuid,
+                            client.tx_characteristic.uuid
+                        )
+
+                return success
+
+            except Exception as e:
+                logger.error(f"Failed to create bridge for {device}: {e}")
+                if addr in self.bridges:
+                    del self.bridges[addr]
+                return False
 
     def _on_bridge_state_change(self, bridge: 'RNodeBridge', new_state: BridgeState):
         """Handle bridge state changes"""
-        logger.info(f"Bridge {bridge.rnode.address} state: {new_state.value}")
+        # Lazy %-formatting: state flips are frequent during reconnect
+        # storms and shouldn't pay for string building when filtered
+        logger.log(logging.INFO, "Bridge %s state: %s", bridge._addr, new_state.value)
+
+        # Wake the monitor so error states are handled without waiting
+        # for the next heartbeat
+        if new_state is BridgeState.ERROR and self._monitor_event is not None:
+            self._monitor_event.set()
 
         # Notify callback
         if self.bridge_state_callback:
-            self.bridge_state_callback(bridge.rnode.address, new_state)
+            self.bridge_state_callback(bridge._addr, new_state)
 
     async def _disconnect_all_bridges(self):
         """Disconnect all active bridges"""
         logger.info("Disconnecting all bridges")
 
-        tasks = []
-        for bridge in self.bridges.values():
-            tasks.append(bridge.disconnect())
+        # Bound parallelism so a large bridge set doesn't flood the
+        # controller with simultaneous disconnects
+        sem = asyncio.Semaphore(4)
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        async def _one(bridge: 'RNodeBridge'):
+            async with sem:
+                await bridge.disconnect()
+
+        if self.bridges:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        *(_one(b) for b in self.bridges.values()),
+                        return_exceptions=True
+                    ),
+                    timeout=25.0
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timed out disconnecting bridges")
 
         self.bridges.clear()
 
 class RNodeBridge:
     """Individual bridge for one RNode device"""
 
+    __slots__ = (
+        'rnode', 'state', 'state_callback', '_addr', 'device_path',
+        'ble_client', 'virtual_serial',
+        'last_connection_attempt', '_next_attempt_at',
+        'reconnect_attempts', 'max_reconnect_attempts',
+        '_loop', '_to_serial', '_to_ble',
+        '_serial_writer_task', '_ble_writer_task'
+    )
+
     def __init__(self, rnode: RNodeDevice, state_callback: Callable[['RNodeBridge', BridgeState], None]):
         self.rnode = rnode
         self.state = BridgeState.DISCONNECTED
         self.state_callback = state_callback
 
+        # Address normalized once; reused everywhere as the map key
+        self._addr = _norm(rnode.address)
+
+        # BlueZ object path, matched against PropertiesChanged signals
+        self.device_path = "/org/bluez/hci0/dev_" + self._addr.replace(':', '_')
+
         # Components
         self.ble_client = BLEGATTClient(rnode)
-        self.virtual_serial = VirtualSerialPort(f"RNode-{rnode.address.replace(':', '')}")
+        self.virtual_serial = VirtualSerialPort(rnode.serial_name)
 
         # Setup callbacks
         self.ble_client.set_data_callback(self._on_ble_data_received)
@@ -263,23 +427,42 @@ class RNodeBridge:
         self.virtual_serial.set_data_callback(self._on_serial_data_received)
         self.virtual_serial.set_connection_callback(self._on_serial_connection_change)
 
-        # Connection tracking
-        self.last_connection_attempt = 0
+        # Connection tracking; monotonic clock so NTP corrections can't
+        # skew the reconnect backoff
+        self.last_connection_attempt = 0.0
+        self._next_attempt_at = 0.0
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
 
+        # Coalescing queues between BLE and serial: packets accumulate
+        # per event-loop tick and are forwarded as one write
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._to_serial: Optional[asyncio.Queue] = None
+        self._to_ble: Optional[asyncio.Queue] = None
+        self._serial_writer_task: Optional[asyncio.Task] = None
+        self._ble_writer_task: Optional[asyncio.Task] = None
+
     async def connect(self) -> bool:
         """Connect the bridge (both BLE and virtual serial)"""
         self._set_state(BridgeState.CONNECTING)
 
         try:
+            self._loop = asyncio.get_running_loop()
+            self._to_serial = asyncio.Queue(maxsize=256)
+            self._to_ble = asyncio.Queue(maxsize=256)
+
             # Create virtual serial port first
             if not self.virtual_serial.open():
                 raise Exception("Failed to create virtual serial port")
 
-            # Connect to BLE device
-            if not await self.ble_client.connect():
-                raise Exception("Failed to connect to BLE device")
+            # Connect to BLE device, one attempt at a time across bridges
+            async with BLESerialBridge._connect_sem:
+                if not await self.ble_client.connect():
+                    raise Exception("Failed to connect to BLE device")
+
+            # Start the coalescing writers for both directions
+            self._serial_writer_task = asyncio.create_task(self._drain_to_serial())
+            self._ble_writer_task = asyncio.create_task(self._drain_to_ble())
 
             self._set_state(BridgeState.CONNECTED)
             self.reconnect_attempts = 0
@@ -304,39 +487,99 @@ class RNodeBridge:
             logger.warning(f"Max reconnect attempts reached for {self.rnode}")
             return False
 
-        if time.time() - self.last_connection_attempt < 10:
-            logger.debug(f"Skipping reconnect for {self.rnode} (too soon)")
+        if time.monotonic() < self._next_attempt_at:
+            logger.debug("Skipping reconnect for %s (backing off)", self.rnode)
             return False
 
-        self.last_connection_attempt = time.time()
+        self.last_connection_attempt = time.monotonic()
         self.reconnect_attempts += 1
 
         logger.info(f"Reconnecting bridge for {self.rnode} (attempt {self.reconnect_attempts})")
         await self.disconnect()
-        return await self.connect()
+        success = await self.connect()
+
+        if not success:
+            # Exponential backoff: 2s, 4s, 8s, 16s, capped at 30s
+            delay = min(30.0, 2.0 * (2 ** (self.reconnect_attempts - 1)))
+            self._next_attempt_at = time.monotonic() + delay
+        else:
+            self._next_attempt_at = 0.0
+
+        return success
 
     def _on_ble_data_received(self, data: bytes):
         """Handle data received from BLE device"""
-        # Forward to virtual serial port
-        self.virtual_serial.send_data(data)
+        # Queue for the serial writer, which coalesces adjacent packets
+        queue = self._to_serial
+        if queue is None:
+            self.virtual_serial.send_data(data)
+            return
+
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("Serial-bound queue full for %s, dropping packet", self.rnode)
 
     def _on_serial_data_received(self, data: bytes):
         """Handle data received from virtual serial port"""
-        # Forward to BLE device
-        self.ble_client.send_data(data)
+        # Called from the serial reader thread — hand off to the loop
+        loop = self._loop
+        if loop is None or self._to_ble is None:
+            self.ble_client.send_data(data)
+            return
+
+        loop.call_soon_threadsafe(self._queue_to_ble, data)
+
+    def _queue_to_ble(self, data: bytes):
+        """Enqueue serial data for the BLE writer (runs on the event loop)"""
+        try:
+            self._to_ble.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("BLE-bound queue full for %s, dropping packet", self.rnode)
+
+    async def _drain_to_serial(self):
+        """Forward BLE data to the pty, one write per drain pass"""
+        queue = self._to_serial
+        send = self.virtual_serial.send_data
+
+        while True:
+            buf = bytearray(await queue.get())
+            while not queue.empty():
+                try:
+                    buf += queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            send(bytes(buf))
+
+    async def _drain_to_ble(self):
+        """Forward serial data to the BLE client, one write per drain pass"""
+        queue = self._to_ble
+        send = self.ble_client.send_data
+
+        while True:
+            buf = bytearray(await queue.get())
+            while not queue.empty():
+                try:
+                    buf += queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            send(bytes(buf))
 
     def _on_ble_connected(self):
         """Handle BLE connection established"""
-        logger.debug(f"BLE connected for {self.rnode}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("BLE connected for %s", self.rnode)
 
     def _on_ble_disconnected(self):
         """Handle BLE connection lost"""
-        logger.warning(f"BLE disconnected for {self.rnode}")
+        logger.warning("BLE disconnected for %s", self.rnode)
         self._set_state(BridgeState.ERROR)
 
     def _on_serial_connection_change(self, connected: bool):
         """Handle virtual serial connection changes"""
-        logger.debug(f"Virtual serial {'connected' if connected else 'disconnected'} for {self.rnode}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Virtual serial %s for %s",
+                         'connected' if connected else 'disconnected', self.rnode)
 
     def _set_state(self, new_state: BridgeState):
         """Update bridge state and notify callback"""
@@ -346,6 +589,18 @@ class RNodeBridge:
 
     async def _cleanup(self):
         """Clean up bridge resources"""
+        for task in (self._serial_writer_task, self._ble_writer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._serial_writer_task = None
+        self._ble_writer_task = None
+        self._to_serial = None
+        self._to_ble = None
+
         await self.ble_client.disconnect()
         self.virtual_serial.close()
 
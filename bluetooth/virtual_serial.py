@@ -7,18 +7,30 @@ import platform
 import tempfile
 import threading
 from typing import Optional, Callable
-from queue import Queue, Empty
+from collections import deque
 import pty
-import select
+import selectors
 import termios
 
 logger = logging.getLogger(__name__)
 
+# Scatter/gather writes where the platform provides them
+_HAS_WRITEV = hasattr(os, 'writev')
+
+# Errnos meaning the client side is gone, one C-level membership test
+_READ_ERRS = frozenset((5, 9))   # EIO, EBADF
+_WRITE_ERRS = frozenset((9, 32))  # EBADF, EPIPE
+
+# Read buffer slab size: BLE packets are MTU-sized (20-240 B), so small
+# slabs keep the whole pool cache-resident; bursts just loop more reads
+_BUF_SIZE = 256
+
 class VirtualSerialPort:
     """Creates a virtual serial port that appears as /dev/pts/X (Linux/macOS)"""
 
     def __init__(self, device_name: str = "RNode"):
         self.device_name = device_name
+        self._symlink_path = f"/tmp/cu.{device_name}"
         self.is_open = False
 
         # PTY file descriptors
@@ -26,18 +38,45 @@ class VirtualSerialPort:
         self.slave_fd: Optional[int] = None
         self.slave_path: Optional[str] = None
 
-        # Data queues
-        self.rx_queue = Queue()  # Data to send to client (from BLE)
-        self.tx_queue = Queue()  # Data received from client (to BLE)
+        # Persistent poller (epoll on Linux, kqueue on macOS) registered
+        # once instead of rebuilding select() fd sets per wait
+        self._selector: Optional[selectors.BaseSelector] = None
+
+        # Data paths: deque append/popleft are atomic in CPython, and one
+        # Event per direction replaces Queue's lock+condition per operation.
+        # Both directions are bounded so a stalled consumer can't grow the
+        # backlog without limit; overflow drops are counted
+        self.max_queued = 256
+        self.rx_deque = deque()  # Data to send to client (from BLE)
+        self.tx_deque = deque()  # Data received from client (to BLE)
+        self.tx_event = threading.Event()
+        self._drops = 0
+
+        # Whether anyone actually polls receive_data; when the callback is
+        # the sole consumer we skip the tx hand-off entirely
+        self._has_pollers = False
+
+        # Self-pipe that wakes the I/O worker; created in open()
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._wants_write = False
 
         # Callbacks
         self.data_callback: Optional[Callable[[bytes], None]] = None
         self.connection_callback: Optional[Callable[[bool], None]] = None
 
-        # Background threads
-        self._read_thread: Optional[threading.Thread] = None
-        self._write_thread: Optional[threading.Thread] = None
+        # Background I/O thread (single thread services both directions)
+        self._io_thread: Optional[threading.Thread] = None
         self._running = False
+        self._dbg = False
+
+        # Reusable read buffers: readv fills a pooled bytearray so each
+        # read costs one copy instead of a fresh heap allocation.
+        # Acquire/return both use the right end (LIFO) so the hottest
+        # buffer stays cache-resident
+        self._buf_pool = deque(bytearray(_BUF_SIZE) for _ in range(64))
+        self._pool_hits = 0
+        self._pool_misses = 0
 
     def set_data_callback(self, callback: Callable[[bytes], None]):
         """Set callback for data received from serial client"""
@@ -54,8 +93,10 @@ class VirtualSerialPort:
             return True
 
         try:
-            # Create PTY pair
+            # Create PTY pair; non-blocking master so one poller wakeup
+            # can drain the whole kernel buffer
             self.master_fd, self.slave_fd = pty.openpty()
+            os.set_blocking(self.master_fd, False)
 
             # Get slave device path
             self.slave_path = os.ttyname(self.slave_fd)
@@ -63,12 +104,27 @@ class VirtualSerialPort:
             # Configure terminal settings
             self._configure_terminal()
 
+            # Register the master fd with a persistent poller
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.master_fd, selectors.EVENT_READ)
+
+            # Self-pipe wakeup for pending writes: no idle polling, and
+            # the first queued packet wakes the worker in one context switch
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+            self._selector.register(self._wake_r, selectors.EVENT_READ)
+
             # Create symlink for easier access (optional)
             self._create_symlink()
 
             self.is_open = True
             self._running = True
 
+            # Cached once per open; per-packet debug logging costs nothing
+            # unless the level was already DEBUG when the port opened
+            self._dbg = logger.isEnabledFor(logging.DEBUG)
+
             # Start background threads
             self._start_threads()
 
@@ -95,6 +151,13 @@ class VirtualSerialPort:
         self._running = False
         self.is_open = False
 
+        # Wake the write worker so it observes shutdown immediately
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'\0')
+            except OSError:
+                pass
+
         # Stop threads
         self._stop_threads()
 
@@ -137,7 +200,7 @@ class VirtualSerialPort:
 
         try:
             # Create symlink in /tmp for easier access
-            symlink_path = f"/tmp/cu.{self.device_name}"
+            symlink_path = self._symlink_path
 
             # Remove existing symlink if present
             if os.path.exists(symlink_path) or os.path.islink(symlink_path):
@@ -152,91 +215,221 @@ class VirtualSerialPort:
             logger.warning(f"Could not create symlink: {e}")
 
     def _start_threads(self):
-        """Start background threads for data handling"""
-        self._read_thread = threading.Thread(target=self._read_worker, daemon=True)
-        self._write_thread = threading.Thread(target=self._write_worker, daemon=True)
-
-        self._read_thread.start()
-        self._write_thread.start()
+        """Start the background I/O thread"""
+        self._io_thread = threading.Thread(target=self._make_io_worker(), daemon=True)
+        self._io_thread.start()
 
     def _stop_threads(self):
-        """Stop background threads"""
-        if self._read_thread and self._read_thread.is_alive():
-            self._read_thread.join(timeout=1.0)
-
-        if self._write_thread and self._write_thread.is_alive():
-            self._write_thread.join(timeout=1.0)
+        """Stop the background I/O thread"""
+        if self._io_thread and self._io_thread.is_alive():
+            self._io_thread.join(timeout=1.0)
+
+    def _make_io_worker(self):
+        """Build the I/O loop specialized for this instance
+
+        The poller, wake fd and hot methods are constant for the thread's
+        lifetime, so they're captured as closure variables instead of
+        being re-resolved through self on every iteration.
+        """
+        selector = self._selector
+        wake_r = self._wake_r
+        read = os.read
+        drain_reads = self._drain_reads
+        flush_writes = self._flush_writes
+
+        def _io_worker():
+            # Single thread servicing both PTY directions: master
+            # readiness drains reads, a wake token flushes queued writes
+            logger.debug("Virtual serial I/O worker started")
+
+            while self._running and self.master_fd is not None:
+                try:
+                    events = selector.select()
 
-    def _read_worker(self):
-        """Background thread to read data from serial client"""
-        logger.debug("Virtual serial read worker started")
+                    woken = False
+                    readable = False
+                    for key, _ in events:
+                        if key.fd == wake_r:
+                            woken = True
+                        else:
+                            readable = True
+
+                    if woken:
+                        try:
+                            read(wake_r, 64)  # drain wakeup tokens
+                        except BlockingIOError:
+                            pass
+                        if not self._running:
+                            break
 
-        while self._running and self.master_fd is not None:
-            try:
-                # Use select to check for data availability
-                ready, _, _ = select.select([self.master_fd], [], [], 0.1)
+                    if readable and not drain_reads():
+                        break
 
-                if ready:
-                    # Read data from master (client)
-                    data = os.read(self.master_fd, 1024)
-                    if data:
-                        logger.debug(f"Read {len(data)} bytes from virtual serial")
+                    if not flush_writes():
+                        break
 
-                        # Add to TX queue (data going to BLE)
-                        self.tx_queue.put(data)
+                except Exception as e:
+                    logger.error(f"Virtual serial I/O worker error: {e}")
+                    break
 
-                        # Call data callback
-                        if self.data_callback:
-                            self.data_callback(data)
+            logger.debug("Virtual serial I/O worker stopped")
 
-            except OSError as e:
-                if e.errno in (9, 5):  # Bad file descriptor or I/O error
-                    logger.debug("Virtual serial read worker: client disconnected")
-                    break
-                else:
-                    logger.error(f"Virtual serial read error: {e}")
-                    break
-            except Exception as e:
-                logger.error(f"Virtual serial read worker error: {e}")
-                break
+        return _io_worker
 
-        logger.debug("Virtual serial read worker stopped")
+    def _drain_reads(self) -> bool:
+        """Read until the master fd runs dry; False when the client is gone"""
+        # Bind the hot names to locals: LOAD_FAST per iteration instead of
+        # attribute lookups at BLE packet rate
+        fd = self.master_fd
+        readv = os.readv
+        pool = self._buf_pool
+        tx_deque = self.tx_deque
+        tx_event = self.tx_event
+        callback = self.data_callback
 
-    def _write_worker(self):
-        """Background thread to write data to serial client"""
-        logger.debug("Virtual serial write worker started")
+        try:
+            while True:
+                if pool:
+                    buf = pool.pop()
+                    self._pool_hits += 1
+                else:
+                    buf = bytearray(_BUF_SIZE)
+                    self._pool_misses += 1
+                view = memoryview(buf)
+                try:
+                    n = readv(fd, (view,))
+                except BlockingIOError:
+                    pool.append(buf)
+                    return True  # kernel buffer drained
+                if n <= 0:
+                    pool.append(buf)
+                    return n != 0  # EOF means the client closed
+
+                data = bytes(view[:n])
+                pool.append(buf)
+
+                if self._dbg:
+                    logger.debug("Read %d bytes from virtual serial", n)
+
+                # Hand off to the BLE side: the callback when registered,
+                # and the TX deque only while someone polls receive_data
+                if callback:
+                    callback(data)
+                    enqueue = self._has_pollers
+                else:
+                    enqueue = True
+
+                if enqueue:
+                    if len(tx_deque) < self.max_queued:
+                        tx_deque.append(data)
+                        tx_event.set()
+                    else:
+                        self._drops += 1
+
+        except OSError as e:
+            if e.errno in _READ_ERRS:
+                logger.debug("Virtual serial I/O worker: client disconnected")
+            else:
+                logger.error(f"Virtual serial read error: {e}")
+            return False
 
-        while self._running and self.master_fd is not None:
-            try:
-                # Get data from RX queue (data from BLE)
+    def _flush_writes(self) -> bool:
+        """Write queued data to the client; False when the client is gone"""
+        fd = self.master_fd
+        rx_deque = self.rx_deque
+        write = os.write
+        writev = os.writev if _HAS_WRITEV else None
+
+        while fd is not None:
+            # Greedily drain everything queued so one syscall covers the
+            # whole backlog
+            bufs = []
+            while True:
                 try:
-                    data = self.rx_queue.get(timeout=0.1)
-                except Empty:
-                    continue
+                    bufs.append(rx_deque.popleft())
+                except IndexError:
+                    break
+            if not bufs:
+                self._arm_write(False)
+                return True
 
-                # Write data to master (client)
-                if self.master_fd is not None:
+            # Write data to master (client); on EAGAIN keep the tail and
+            # wait for the fd to become writable again
+            try:
+                if writev is not None and len(bufs) > 1:
                     try:
-                        os.write(self.master_fd, data)
-                        logger.debug(f"Wrote {len(data)} bytes to virtual serial")
-                    except OSError as e:
-                        if e.errno in (9, 32):  # Bad file descriptor or broken pipe
-                            logger.debug("Virtual serial write worker: client disconnected")
-                            break
-                        else:
-                            logger.error(f"Virtual serial write error: {e}")
-                            # Re-queue the data
-                            self.rx_queue.put(data)
+                        written = writev(fd, bufs)
+                    except BlockingIOError:
+                        rx_deque.appendleft(b''.join(bufs))
+                        self._arm_write(True)
+                        return True
+                    total = sum(len(b) for b in bufs)
+                    if written < total:
+                        # Short write: re-queue the unwritten tail
+                        rx_deque.appendleft(b''.join(bufs)[written:])
+                        self._arm_write(True)
+                        return True
+                    if self._dbg:
+                        logger.debug("Wrote %d bytes to virtual serial", written)
+                else:
+                    data = bufs[0] if len(bufs) == 1 else b''.join(bufs)
+                    written = 0
+                    try:
+                        written = write(fd, data)
+                        while written < len(data):
+                            written += write(fd, data[written:])
+                    except BlockingIOError:
+                        rx_deque.appendleft(data[written:])
+                        self._arm_write(True)
+                        return True
+                    if self._dbg:
+                        logger.debug("Wrote %d bytes to virtual serial", written)
+            except OSError as e:
+                if e.errno in _WRITE_ERRS:
+                    logger.debug("Virtual serial I/O worker: client disconnected")
+                    return False
+                else:
+                    logger.error(f"Virtual serial write error: {e}")
+                    # Re-queue the data and retry on the next wakeup
+                    rx_deque.appendleft(b''.join(bufs))
+                    return True
 
-                self.rx_queue.task_done()
+        return True
 
-            except Exception as e:
-                logger.error(f"Virtual serial write worker error: {e}")
+    def _arm_write(self, enable: bool):
+        """Toggle write-readiness interest on the master fd"""
+        if self._wants_write == enable or self._selector is None:
+            return
+        self._wants_write = enable
 
-        logger.debug("Virtual serial write worker stopped")
+        mask = selectors.EVENT_READ
+        if enable:
+            mask |= selectors.EVENT_WRITE
+        try:
+            self._selector.modify(self.master_fd, mask)
+        except Exception as e:
+            logger.debug(f"Could not update poller interest: {e}")
 
     def _cleanup(self):
         """Clean up resources"""
+        # Close the poller before its registered fds
+        if self._selector is not None:
+            try:
+                self._selector.close()
+            except Exception:
+                pass
+            self._selector = None
+
+        # Close the self-pipe
+        for attr in ('_wake_r', '_wake_w'):
+            fd = getattr(self, attr)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                setattr(self, attr, None)
+
         # Close file descriptors
         if self.master_fd is not None:
             try:
@@ -254,7 +447,7 @@ class VirtualSerialPort:
 
         # Remove symlink
         if self.slave_path:
-            symlink_path = f"/tmp/cu.{self.device_name}"
+            symlink_path = self._symlink_path
             try:
                 if os.path.exists(symlink_path) or os.path.islink(symlink_path):
                     os.unlink(symlink_path)
@@ -268,8 +461,16 @@ class VirtualSerialPort:
         if not self.is_open:
             return False
 
+        if len(self.rx_deque) >= self.max_queued:
+            self._drops += 1
+            return False
+
         try:
-            self.rx_queue.put(data)
+            self.rx_deque.append(data)
+            try:
+                os.write(self._wake_w, b'\0')
+            except BlockingIOError:
+                pass  # pipe full — a wakeup is already pending
             return True
         except Exception as e:
             logger.error(f"Error queuing data for virtual serial: {e}")
@@ -277,9 +478,20 @@ class VirtualSerialPort:
 
     def receive_data(self, timeout: float = 0.1) -> Optional[bytes]:
         """Get data from serial client (to BLE)"""
+        self._has_pollers = True
+
+        try:
+            return self.tx_deque.popleft()
+        except IndexError:
+            pass
+
+        if not self.tx_event.wait(timeout):
+            return None
+        self.tx_event.clear()
+
         try:
-            return self.tx_queue.get(timeout=timeout)
-        except Empty:
+            return self.tx_deque.popleft()
+        except IndexError:
             return None
 
     def get_device_path(self) -> Optional[str]:
@@ -288,7 +500,7 @@ class VirtualSerialPort:
 
     def get_symlink_path(self) -> str:
         """Get the symlink path for easier access"""
-        return f"/tmp/cu.{self.device_name}"
+        return self._symlink_path
 
     def get_info(self) -> dict:
         """Get virtual serial port information"""
@@ -299,6 +511,9 @@ class VirtualSerialPort:
             'is_open': self.is_open,
             'master_fd': self.master_fd,
             'slave_fd': self.slave_fd,
-            'rx_queue_size': self.rx_queue.qsize(),
-            'tx_queue_size': self.tx_queue.qsize()
+            'rx_queue_size': len(self.rx_deque),
+            'tx_queue_size': len(self.tx_deque),
+            'dropped_packets': self._drops,
+            'pool_hit_rate': (self._pool_hits / (self._pool_hits + self._pool_misses)
+                              if (self._pool_hits or self._pool_misses) else 1.0)
         }
\ No newline at end of file